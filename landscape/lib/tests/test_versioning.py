@@ -19,6 +19,19 @@ class IsVersionHigherTest(TestCase):
         """
         self.assertTrue(is_version_higher(b"3.1", b"3.1"))
 
+    def test_equal_invalid(self):
+        """
+        The C{is_version_higher} function raises a C{ValueError} even if
+        both invalid versions are the same.
+        """
+        self.assertRaises(
+            ValueError,
+            is_version_higher,
+            b"garbage",
+            b"garbage",
+        )
+        self.assertRaises(ValueError, is_version_higher, b"3", b"3")
+
     def test_lower(self):
         """
         The C{is_version_higher} function returns C{False} if the first
@@ -26,6 +39,62 @@ class IsVersionHigherTest(TestCase):
         """
         self.assertFalse(is_version_higher(b"3.1", b"3.2"))
 
+    def test_trailing_zeros(self):
+        """
+        Trailing zero components don't make a version higher.
+        """
+        self.assertTrue(is_version_higher(b"3.1", b"3.1.0"))
+        self.assertTrue(is_version_higher(b"3.1.0", b"3.1"))
+
+    def test_different_lengths(self):
+        """
+        The C{is_version_higher} function compares versions with a different
+        number of components.
+        """
+        self.assertTrue(is_version_higher(b"3.1.5", b"3.1"))
+        self.assertFalse(is_version_higher(b"3.1", b"3.1.5"))
+        self.assertTrue(is_version_higher(b"3.10", b"3.9.9"))
+
+    def test_two_part_versions(self):
+        """
+        Plain b"x.y" versions are compared by their numeric components,
+        including multi-digit ones, and compare the same way against
+        longer versions.
+        """
+        self.assertTrue(is_version_higher(b"3.10", b"3.9"))
+        self.assertFalse(is_version_higher(b"3.9", b"3.10"))
+        self.assertTrue(is_version_higher(b"10.0", b"9.99"))
+        self.assertTrue(is_version_higher(b"03.1", b"3.1"))
+        self.assertTrue(is_version_higher(b"3.1", b"03.1"))
+        self.assertTrue(is_version_higher(b"3.0", b"3.0.0"))
+        self.assertTrue(is_version_higher(b"3.0.0", b"3.0"))
+        self.assertTrue(is_version_higher(b"3.10", b"3.9.9"))
+        self.assertFalse(is_version_higher(b"3.9", b"3.9.1"))
+        self.assertEqual(
+            [b"10.0", b"9.99", b"3.10", b"3.9", b"3.1"],
+            sort_versions([b"3.9", b"10.0", b"3.1", b"9.99", b"3.10"]),
+        )
+
+    def test_pre_release(self):
+        """
+        The C{is_version_higher} function also handles pre-release versions,
+        which are lower than the matching final release.
+        """
+        self.assertTrue(is_version_higher(b"3.2", b"3.2b1"))
+        self.assertFalse(is_version_higher(b"3.2a1", b"3.2"))
+
+    def test_invalid(self):
+        """
+        The C{is_version_higher} function raises a C{ValueError} if one of
+        the versions isn't valid.
+        """
+        self.assertRaises(ValueError, is_version_higher, b"3.2", b"3.2c1")
+        self.assertRaises(ValueError, is_version_higher, b"three", b"3.2")
+        self.assertRaises(ValueError, is_version_higher, b"3", b"3.1")
+        self.assertRaises(ValueError, is_version_higher, b"1.2.3.4", b"1.2")
+        self.assertRaises(ValueError, is_version_higher, b"3b1", b"3.1")
+        self.assertRaises(ValueError, is_version_higher, b"3..1", b"3.1")
+
 
 class SortVersionsTest(TestCase):
     def test_sort(self):
@@ -35,3 +104,14 @@ class SortVersionsTest(TestCase):
         """
         versions = [b"3.2", b"3.3", b"3.1"]
         self.assertEqual([b"3.3", b"3.2", b"3.1"], sort_versions(versions))
+
+    def test_sort_pre_release(self):
+        """
+        Pre-release versions are sorted before the matching final release
+        and the given versions are returned unchanged.
+        """
+        versions = [b"3.2b1", b"3.1", b"3.2", b"3.2a2"]
+        self.assertEqual(
+            [b"3.2", b"3.2b1", b"3.2a2", b"3.1"],
+            sort_versions(versions),
+        )
@@ -1,5 +1,58 @@
 """Helpers for dealing with software versioning."""
-from distutils.version import StrictVersion
+from functools import lru_cache
+
+
+# Bytes made only of these characters are plain dotted numeric versions.
+_SIMPLE = frozenset(b"0123456789.")
+
+# Letters introducing a pre-release suffix, as in b"3.2a1" or b"3.2b1".
+_PRERELEASE_MARKERS = (b"a", b"b")
+
+# Pre-release marker of a final release, it sorts after any (0, "a", N) or
+# (0, "b", N) pre-release tuple.
+_FINAL = (1,)
+
+
+def _strip_zeros(parts):
+    """Drop trailing zero components from a C{tuple} of ints.
+
+    This makes b"3.1" and b"3.1.0" compare equal.
+    """
+    end = len(parts)
+    while end > 1 and parts[end - 1] == 0:
+        end -= 1
+    return parts[:end]
+
+
+@lru_cache(maxsize=1024)
+def _version_key(version):
+    """Parse a C{bytes} version into a key suitable for comparisons.
+
+    Versions are made of two or three dot-separated numbers, optionally
+    followed by an b"a" or b"b" pre-release suffix, e.g. b"3.2", b"3.2.1"
+    or b"3.2b1".
+
+    @raises ValueError: If C{version} isn't a valid version.
+    """
+    # Server API versions are almost always plain b"x.y" ones, which don't
+    # need the full parsing below.
+    major, dot, minor = version.partition(b".")
+    if dot and major.isdigit() and minor.isdigit():
+        return (_strip_zeros((int(major), int(minor))), _FINAL)
+    number = version
+    prerelease = _FINAL
+    if not _SIMPLE.issuperset(version):
+        for marker in _PRERELEASE_MARKERS:
+            number, found, serial = version.partition(marker)
+            if found:
+                break
+        if not found or not serial.isdigit() or not _SIMPLE.issuperset(number):
+            raise ValueError(f"invalid version number {version!r}")
+        prerelease = (0, marker.decode("ascii"), int(serial))
+    parts = number.split(b".")
+    if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts):
+        raise ValueError(f"invalid version number {version!r}")
+    return (_strip_zeros(tuple(map(int, parts))), prerelease)
 
 
 def is_version_higher(version1, version2):
@@ -17,21 +70,14 @@ def is_version_higher(version1, version2):
     @return: C{True} if the first version is greater than or equal to
         the second.
     """
-    version1 = version1.decode("ascii")
-    version2 = version2.decode("ascii")
-    return StrictVersion(version1) >= StrictVersion(version2)
+    return _version_key(version1) >= _version_key(version2)
 
 
 def sort_versions(versions):
     """Sort a list of software versions in from the highest to the lowest.
 
+    Each version is parsed only once, rather than on every comparison.
+
     @param version: a C{list} of C{bytes} describing a version.
     """
-    strict_versions = sorted(
-        [StrictVersion(version.decode("ascii")) for version in versions],
-        reverse=True,
-    )
-    return [
-        str(strict_version).encode("ascii")
-        for strict_version in strict_versions
-    ]
+    return sorted(versions, key=_version_key, reverse=True)
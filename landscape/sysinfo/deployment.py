@@ -87,9 +87,11 @@ class SysInfoConfiguration(BaseConfiguration):
         else:
             include = self.get_plugin_names(self.sysinfo_plugins)
         if self.exclude_sysinfo_plugins is None:
-            exclude = []
+            exclude = frozenset()
         else:
-            exclude = self.get_plugin_names(self.exclude_sysinfo_plugins)
+            exclude = frozenset(
+                self.get_plugin_names(self.exclude_sysinfo_plugins),
+            )
         plugins = [x for x in include if x not in exclude]
         return [
             namedClass(
@@ -113,8 +115,11 @@ def get_landscape_log_directory(landscape_dir=None):
 
 
 def setup_logging(landscape_dir=None):
-    landscape_dir = get_landscape_log_directory(landscape_dir)
     logger = getLogger("landscape-sysinfo")
+    if logger.handlers:
+        # Logging has already been set up, don't open the log file again.
+        return
+    landscape_dir = get_landscape_log_directory(landscape_dir)
     logger.propagate = False
     if not os.path.isdir(landscape_dir):
         os.mkdir(landscape_dir)
@@ -1,5 +1,6 @@
 import os
 import unittest
+from collections import deque
 from logging import getLogger
 from logging.handlers import RotatingFileHandler
 from unittest import mock
@@ -75,8 +76,8 @@ class FakeReactor:
     """
 
     def __init__(self):
-        self.queued_calls = []
-        self.scheduled_calls = []
+        self.queued_calls = deque()
+        self.scheduled_calls = deque()
         self.running = False
 
     def callWhenRunning(self, callable):  # noqa: N802
@@ -91,6 +92,10 @@ class FakeReactor:
     def stop(self):
         self.running = False
 
+    def run_queued_calls(self):
+        while self.queued_calls:
+            self.queued_calls.popleft()()
+
 
 class RunTest(
     HelperTestCase,
@@ -203,8 +208,7 @@ class RunTest(
         self.assertEqual(self.stdout.getvalue(), "")
 
         self.assertTrue(reactor.running)
-        for x in reactor.queued_calls:
-            x()
+        reactor.run_queued_calls()
 
         self.assertEqual(
             self.stdout.getvalue(),
@@ -218,9 +222,11 @@ class RunTest(
         """
         reactor = FakeReactor()
         d = run(["--sysinfo-plugins", "TestPlugin"], reactor=reactor)
-        for x in reactor.queued_calls:
-            x()
-        self.assertEqual(reactor.scheduled_calls, [(0, reactor.stop, (), {})])
+        reactor.run_queued_calls()
+        self.assertEqual(
+            list(reactor.scheduled_calls),
+            [(0, reactor.stop, (), {})],
+        )
         return d
 
     def test_stop_reactor_even_when_sync_exception_from_sysinfo_run(self):
@@ -238,10 +244,12 @@ class RunTest(
             sysinfo=sysinfo,
         )
 
-        for x in reactor.queued_calls:
-            x()
+        reactor.run_queued_calls()
 
-        self.assertEqual(reactor.scheduled_calls, [(0, reactor.stop, (), {})])
+        self.assertEqual(
+            list(reactor.scheduled_calls),
+            [(0, reactor.stop, (), {})],
+        )
         return self.assertFailure(d, ZeroDivisionError)
 
     def test_get_landscape_log_directory_unprivileged(self):
@@ -283,6 +291,18 @@ class RunTest(
         self.assertEqual(handler.backupCount, 1)
         self.assertFalse(logger.propagate)
 
+    def test_setup_logging_only_once(self):
+        """
+        Calling setup_logging again doesn't add another handler to the
+        "landscape-sysinfo" logger.
+        """
+        landscape_dir = self.makeDir()
+        setup_logging(landscape_dir=landscape_dir)
+        logger = getLogger("landscape-sysinfo")
+        [handler] = logger.handlers
+        setup_logging(landscape_dir=landscape_dir)
+        self.assertEqual(logger.handlers, [handler])
+
     def test_setup_logging_logs_to_var_log_if_run_as_root(self):
         with mock.patch.object(
             os,